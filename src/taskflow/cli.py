@@ -1,24 +1,16 @@
 """CLI entry point for TaskFlow."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.prompt import Confirm
 
 from taskflow import __app_name__, __version__
 from taskflow.config import LoopConfig, TaskConfig, TaskStats
-from taskflow.progress import ProgressManager
-from taskflow.report import (
-    display_summary,
-    generate_report,
-    save_report,
-    view_report_interactive,
-)
-from taskflow.splash import display_splash
-from taskflow.tasks import run_tasks
 
 app = typer.Typer(
     name=__app_name__,
@@ -27,44 +19,22 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
 loop_config = LoopConfig()
 
 
+@cache
+def get_console() -> Console:
+    """Return the shared console, creating it on first use."""
+    return Console()
+
+
 def version_callback(value: bool) -> None:
     """Display version and exit."""
     if value:
-        console.print(f"{__app_name__} version {__version__}")
+        get_console().print(f"{__app_name__} version {__version__}")
         raise typer.Exit()
 
 
-def validate_outer(value: int) -> int:
-    """Validate outer iteration count."""
-    if not loop_config.outer_min <= value <= loop_config.outer_max:
-        raise typer.BadParameter(
-            f"Must be between {loop_config.outer_min} and {loop_config.outer_max}"
-        )
-    return value
-
-
-def validate_middle(value: int) -> int:
-    """Validate middle iteration count."""
-    if not loop_config.middle_min <= value <= loop_config.middle_max:
-        raise typer.BadParameter(
-            f"Must be between {loop_config.middle_min} and {loop_config.middle_max}"
-        )
-    return value
-
-
-def validate_inner(value: int) -> int:
-    """Validate inner iteration count."""
-    if not loop_config.inner_min <= value <= loop_config.inner_max:
-        raise typer.BadParameter(
-            f"Must be between {loop_config.inner_min} and {loop_config.inner_max}"
-        )
-    return value
-
-
 def validate_report_path(value: Path) -> Path:
     """Validate report path."""
     if value.suffix.lower() != ".md":
@@ -80,7 +50,8 @@ def run(
             "--outer",
             "-o",
             help=f"Number of outer loop iterations ({loop_config.outer_min}-{loop_config.outer_max})",
-            callback=validate_outer,
+            min=loop_config.outer_min,
+            max=loop_config.outer_max,
             show_default=True,
         ),
     ] = 5,
@@ -90,7 +61,8 @@ def run(
             "--middle",
             "-m",
             help=f"Number of middle loop iterations ({loop_config.middle_min}-{loop_config.middle_max})",
-            callback=validate_middle,
+            min=loop_config.middle_min,
+            max=loop_config.middle_max,
             show_default=True,
         ),
     ] = 3,
@@ -100,7 +72,8 @@ def run(
             "--inner",
             "-i",
             help=f"Max inner loop iterations ({loop_config.inner_min}-{loop_config.inner_max})",
-            callback=validate_inner,
+            min=loop_config.inner_min,
+            max=loop_config.inner_max,
             show_default=True,
         ),
     ] = 10,
@@ -125,6 +98,13 @@ def run(
             show_default=True,
         ),
     ] = 0.3,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help="Show per-inner-loop progress and log every short-circuit in the report",
+        ),
+    ] = False,
     no_splash: Annotated[
         bool,
         typer.Option(
@@ -155,8 +135,12 @@ def run(
 
     The inner loop may short-circuit randomly based on the probability setting.
     """
+    console = get_console()
+
     # Display splash screen
     if not no_splash:
+        from taskflow.splash import display_splash
+
         display_splash(console)
 
     # Create configuration
@@ -167,6 +151,7 @@ def run(
             inner_iterations=inner,
             short_circuit_probability=short_circuit_prob,
             report_path=report,
+            verbose=verbose,
         )
     except ValueError as e:
         console.print(f"[red]Configuration error:[/red] {e}")
@@ -183,6 +168,16 @@ def run(
     console.print(f"  Report path:       [cyan]{report}[/cyan]")
     console.print()
 
+    # Heavy modules (numpy/numba, markdown rendering) are only needed from here on
+    from taskflow.progress import ProgressManager
+    from taskflow.report import (
+        display_summary,
+        generate_report,
+        save_report,
+        view_report_interactive,
+    )
+    from taskflow.tasks import run_tasks
+
     # Calculate total inner steps for progress bar
     total_inner_steps = middle * inner
 
@@ -192,11 +187,20 @@ def run(
             console=console,
             outer_total=outer,
             inner_total=total_inner_steps,
+            verbose=verbose,
         ) as progress:
             await run_tasks(config, stats, progress)
 
+    # uvloop is not available on Windows; fall back to the default event loop
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
     try:
-        asyncio.run(execute())
+        asyncio.run(execute(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         console.print("\n[yellow]Execution cancelled by user.[/yellow]")
         raise typer.Exit(130) from None
@@ -204,18 +208,31 @@ def run(
     # Display summary
     display_summary(console, config, stats)
 
-    # Generate and save report
+    # Generate the report and write it in a worker thread while the user
+    # reads the commands and answers the prompt
     report_content = generate_report(config, stats)
-    save_report(report_content, report)
-    console.print(f"[green]Report saved to:[/green] {report.absolute()}")
-    console.print()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        save_future = executor.submit(save_report, report_content, report)
+
+        # Ask if user wants to view the report
+        console.print("[bold]Commands:[/bold]")
+        console.print(f"  View report: [cyan]taskflow view {report}[/cyan]")
+        console.print()
+
+        from rich.prompt import Confirm
 
-    # Ask if user wants to view the report
-    console.print("[bold]Commands:[/bold]")
-    console.print(f"  View report: [cyan]taskflow view {report}[/cyan]")
+        view_now = Confirm.ask("Would you like to view the report now?", default=True)
+
+        try:
+            save_future.result()
+        except OSError as e:
+            console.print(f"[red]Error:[/red] Could not save report: {e}")
+            raise typer.Exit(1) from e
+
+    console.print(f"[green]Report saved to:[/green] {report.absolute()}")
     console.print()
 
-    if Confirm.ask("Would you like to view the report now?", default=True):
+    if view_now:
         view_report_interactive(console, report)
 
 
@@ -241,6 +258,9 @@ def view(
     [bold]Example:[/bold]
         taskflow view report.md
     """
+    from taskflow.report import view_report_interactive
+
+    console = get_console()
     if report_path.suffix.lower() != ".md":
         console.print("[red]Error:[/red] File must be a markdown (.md) file")
         raise typer.Exit(1)
@@ -1,8 +1,11 @@
 """Configuration and constants for TaskFlow."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
+STATS_MESSAGE_CAP = 10000
+
 
 @dataclass(frozen=True)
 class LoopConfig:
@@ -16,7 +19,7 @@ class LoopConfig:
     inner_max: int = 20
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskConfig:
     """Runtime configuration for task execution."""
 
@@ -27,9 +30,11 @@ class TaskConfig:
     sleep_min: float = 0.01
     sleep_max: float = 0.05
     report_path: Path = field(default_factory=lambda: Path("report.md"))
+    verbose: bool = False
+    sleep_span: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate configuration values."""
+        """Validate configuration values and precompute derived constants."""
         loop_config = LoopConfig()
 
         if not loop_config.outer_min <= self.outer_iterations <= loop_config.outer_max:
@@ -44,8 +49,10 @@ class TaskConfig:
             msg = f"inner_iterations must be between {loop_config.inner_min} and {loop_config.inner_max}"
             raise ValueError(msg)
 
+        object.__setattr__(self, "sleep_span", self.sleep_max - self.sleep_min)
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskStats:
     """Statistics collected during task execution."""
 
@@ -54,8 +61,24 @@ class TaskStats:
     total_inner_iterations: int = 0
     short_circuit_count: int = 0
     total_elapsed_seconds: float = 0.0
-    messages: list[str] = field(default_factory=list)
+    header_messages: list[str] = field(default_factory=list)
+    messages: deque[str] = field(default_factory=lambda: deque(maxlen=STATS_MESSAGE_CAP))
+    dropped_messages: int = 0
+
+    def add_header_message(self, message: str) -> None:
+        """Add a message to the stats log that is never evicted."""
+        self.header_messages.append(message)
 
     def add_message(self, message: str) -> None:
-        """Add a message to the stats log."""
+        """Add a message to the stats log, evicting the oldest once it is full."""
+        if len(self.messages) == self.messages.maxlen:
+            self.dropped_messages += 1
         self.messages.append(message)
+
+    def log_lines(self) -> list[str]:
+        """Return the stats log, noting how many messages were evicted."""
+        lines = list(self.header_messages)
+        if self.dropped_messages:
+            lines.append(f"... {self.dropped_messages} earlier messages omitted ...")
+        lines.extend(self.messages)
+        return lines
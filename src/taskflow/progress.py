@@ -1,45 +1,55 @@
 """Progress bar management for TaskFlow."""
 
+import asyncio
+import contextlib
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from time import perf_counter
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from time import monotonic_ns
 
-from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    Task,
     TaskID,
     TextColumn,
     TimeElapsedColumn,
 )
+from rich.progress_bar import ProgressBar
 from rich.table import Table
+from rich.text import Text
 
-if TYPE_CHECKING:
-    from rich.console import Console as ConsoleType
+MESSAGE_CAP = 10
+NS_PER_SEC = 1_000_000_000
+_MESSAGE_PREFIX = Text.from_markup("  [dim]>[/dim] ")
 
 
-class DynamicLayout:
-    """Wrapper that recalculates elapsed times on each render."""
-
-    def __init__(self, progress_manager: "ProgressManager") -> None:
-        self._progress_manager = progress_manager
-
-    def __rich_console__(
-        self, console: "ConsoleType", options: ConsoleOptions
-    ) -> RenderResult:
-        """Render the layout with updated elapsed times."""
-        self._progress_manager._refresh_time_displays()
-        yield self._progress_manager._create_layout()
+@lru_cache(maxsize=4096)
+def _fmt_int(seconds: int) -> str:
+    """Format whole seconds into HH:MM:SS format."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
 def format_time(seconds: float) -> str:
     """Format seconds into HH:MM:SS format."""
-    hours, remainder = divmod(int(seconds), 3600)
-    minutes, secs = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return _fmt_int(int(seconds))
+
+
+class TaskStyledBarColumn(BarColumn):
+    """Bar column that takes its complete/finished styles from task fields."""
+
+    def render(self, task: Task) -> ProgressBar:
+        """Render the bar using the task's ``complete_style``/``finished_style``."""
+        bar = super().render(task)
+        bar.complete_style = task.fields["complete_style"]
+        bar.finished_style = task.fields["finished_style"]
+        return bar
 
 
 @dataclass
@@ -49,24 +59,34 @@ class ProgressManager:
     console: Console
     outer_total: int
     inner_total: int
-    _outer_progress: Progress = field(init=False)
-    _inner_progress: Progress = field(init=False)
+    verbose: bool = False
+    _progress: Progress = field(init=False)
     _outer_task: TaskID = field(init=False)
     _inner_task: TaskID = field(init=False)
+    _message_panel: Panel = field(init=False)
+    _layout_panel: Panel = field(init=False)
     _live: Live = field(init=False)
-    _messages: list[str] = field(default_factory=list)
-    _outer_start_time: float = field(default=0.0)
-    _inner_start_time: float = field(default=0.0)
+    _tick_task: asyncio.Task[None] = field(init=False)
+    _messages: list[str | Text] = field(default_factory=lambda: [""] * MESSAGE_CAP)
+    _msg_idx: int = field(default=0)
+    _outer_start_ns: int = field(default=0)
+    _inner_start_ns: int = field(default=0)
     _current_outer_step: int = field(default=0)
     _current_inner_step: int = field(default=0)
     _inner_completed_steps: int = field(default=0)
+    _inner_pushed_steps: int = field(default=0)
+    _inner_total_steps: int = field(default=0)
+    _last_outer_sec: int = field(default=-1)
+    _last_inner_sec: int = field(default=-1)
 
     def __post_init__(self) -> None:
         """Initialize progress bars."""
-        self._outer_progress = Progress(
+        # One Progress holds both bars so they share columns and a single
+        # render pass; per-bar label and colours come from task fields
+        self._progress = Progress(
             SpinnerColumn(),
-            TextColumn("[bold blue]Outer Loop[/bold blue]"),
-            BarColumn(bar_width=40, complete_style="green", finished_style="bright_green"),
+            TextColumn("{task.fields[label]}"),
+            TaskStyledBarColumn(bar_width=40),
             TextColumn("[progress.percentage]{task.percentage:>6.1f}%"),
             TextColumn("•"),
             TextColumn("[cyan]{task.fields[time_display]}[/cyan]"),
@@ -76,123 +96,169 @@ class ProgressManager:
             expand=False,
         )
 
-        self._inner_progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[bold yellow]Inner Loop[/bold yellow]"),
-            BarColumn(bar_width=40, complete_style="yellow", finished_style="bright_yellow"),
-            TextColumn("[progress.percentage]{task.percentage:>6.1f}%"),
-            TextColumn("•"),
-            TextColumn("[cyan]{task.fields[time_display]}[/cyan]"),
-            TextColumn("•"),
-            TextColumn("[dim]{task.fields[status]}[/dim]"),
-            console=self.console,
-            expand=False,
+        # The panel skeleton is built once; Live re-renders the progress bars in
+        # place and only the activity log table is rebuilt per render.
+        self._message_panel = Panel(
+            "",
+            title="[bold]Activity Log[/bold]",
+            border_style="dim",
+            padding=(0, 1),
         )
 
-    def _refresh_time_displays(self) -> None:
-        """Refresh the elapsed time displays for both progress bars."""
-        if self._outer_start_time > 0:
-            outer_elapsed = perf_counter() - self._outer_start_time
-            self._outer_progress.update(
-                self._outer_task,
-                time_display=format_time(outer_elapsed),
-            )
-        if self._inner_start_time > 0:
-            inner_elapsed = perf_counter() - self._inner_start_time
-            self._inner_progress.update(
-                self._inner_task,
-                time_display=format_time(inner_elapsed),
-            )
-
-    def _create_layout(self) -> Panel:
-        """Create the combined layout with progress bars and messages."""
-        progress_table = Table.grid(expand=True)
-        progress_table.add_row(self._outer_progress)
-        progress_table.add_row(self._inner_progress)
-
-        message_table = Table.grid(expand=True)
-        recent_messages = self._messages[-10:] if self._messages else ["Waiting for tasks..."]
-        for msg in recent_messages:
-            message_table.add_row(f"  [dim]>[/dim] {msg}")
-
         layout = Table.grid(expand=True, padding=(0, 0))
         layout.add_row(
             Panel(
-                progress_table,
+                self._progress,
                 title="[bold]Progress[/bold]",
                 border_style="bright_blue",
                 padding=(0, 1),
             )
         )
-        layout.add_row(
-            Panel(
-                message_table,
-                title="[bold]Activity Log[/bold]",
-                border_style="dim",
-                padding=(0, 1),
-            )
-        )
+        layout.add_row(self._message_panel)
 
-        return Panel(
+        self._layout_panel = Panel(
             layout,
             title="[bold magenta]TaskFlow Execution[/bold magenta]",
             border_style="magenta",
         )
 
+    def _refresh_time_displays(self) -> None:
+        """Refresh the elapsed time displays whose displayed second has changed."""
+        now = monotonic_ns()
+        if self._outer_start_ns > 0:
+            outer_sec = (now - self._outer_start_ns) // NS_PER_SEC
+            if outer_sec != self._last_outer_sec:
+                self._last_outer_sec = outer_sec
+                self._progress.update(
+                    self._outer_task,
+                    time_display=_fmt_int(outer_sec),
+                )
+        if self._inner_start_ns > 0:
+            inner_sec = (now - self._inner_start_ns) // NS_PER_SEC
+            if inner_sec != self._last_inner_sec:
+                self._last_inner_sec = inner_sec
+                self._progress.update(
+                    self._inner_task,
+                    time_display=_fmt_int(inner_sec),
+                )
+
+    def _push_inner_completed(self) -> None:
+        """Push inner progress recorded via set_inner_completed to the bar."""
+        step = self._inner_completed_steps
+        if step != self._inner_pushed_steps:
+            self._inner_pushed_steps = step
+            self._progress.update(
+                self._inner_task,
+                completed=step,
+                status=f"{step}/{self._inner_total_steps}",
+            )
+
+    async def _ticker(self) -> None:
+        """Refresh inner progress and elapsed time displays every 100 ms."""
+        while True:
+            await asyncio.sleep(0.1)
+            self._push_inner_completed()
+            self._refresh_time_displays()
+
+    def _create_layout(self) -> Panel:
+        """Refresh the activity log and return the combined layout."""
+        message_table = Table.grid(expand=True)
+        if self._msg_idx == 0:
+            message_table.add_row("  [dim]>[/dim] Waiting for tasks...")
+        # Walk the ring buffer from the oldest slot; unfilled slots are empty
+        for i in range(MESSAGE_CAP):
+            msg = self._messages[(self._msg_idx + i) % MESSAGE_CAP]
+            if isinstance(msg, Text):
+                message_table.add_row(Text.assemble(_MESSAGE_PREFIX, msg))
+            elif msg:
+                message_table.add_row(f"  [dim]>[/dim] {msg}")
+
+        self._message_panel.renderable = message_table
+        return self._layout_panel
+
     async def __aenter__(self) -> "ProgressManager":
         """Start the live display."""
-        self._outer_task = self._outer_progress.add_task(
+        self._outer_task = self._progress.add_task(
             "outer",
             total=self.outer_total,
+            label="[bold blue]Outer Loop[/bold blue]",
+            complete_style="green",
+            finished_style="bright_green",
             time_display="00:00:00",
             status=f"0/{self.outer_total}",
         )
-        self._inner_task = self._inner_progress.add_task(
+        self._inner_task = self._progress.add_task(
             "inner",
             total=self.inner_total,
+            label="[bold yellow]Inner Loop[/bold yellow]",
+            complete_style="yellow",
+            finished_style="bright_yellow",
             time_display="00:00:00",
             status=f"0/{self.inner_total}",
         )
 
-        self._outer_start_time = perf_counter()
-        self._inner_start_time = perf_counter()
+        self._outer_start_ns = monotonic_ns()
+        self._inner_start_ns = self._outer_start_ns
 
-        # Use DynamicLayout to ensure elapsed times update on each render cycle
+        # Live pulls a fresh layout on each refresh; elapsed times are pushed
+        # into the progress bars by the ticker rather than from the render path
         self._live = Live(
-            DynamicLayout(self),
+            get_renderable=self._create_layout,
             console=self.console,
+            auto_refresh=True,
             refresh_per_second=10,
             transient=False,
         )
         self._live.__enter__()
+        self._tick_task = asyncio.create_task(self._ticker())
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        """Stop the live display."""
+        """Stop the ticker and the live display."""
+        self._tick_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._tick_task
         self._live.__exit__(*args)
 
-    def add_message(self, message: str) -> None:
-        """Add a message to the activity log."""
-        self._messages.append(message)
+    def add_message(self, message: str | Text) -> None:
+        """Add a message to the activity log.
+
+        Strings are parsed as Rich markup on render; pre-built ``Text`` is used
+        as-is.
+        """
+        self._messages[self._msg_idx % MESSAGE_CAP] = message
+        self._msg_idx += 1
         self._update_display()
 
+    def add_verbose_message(self, build: Callable[[], str | Text]) -> None:
+        """Add a message to the activity log in verbose mode only.
+
+        ``build`` is only called in verbose mode, so the message is never
+        formatted otherwise.
+        """
+        if self.verbose:
+            self.add_message(build())
+
     def advance_outer(self, step: int) -> None:
         """Advance the outer progress bar."""
         self._current_outer_step = step
-        elapsed = perf_counter() - self._outer_start_time
-        self._outer_progress.update(
+        elapsed_sec = (monotonic_ns() - self._outer_start_ns) // NS_PER_SEC
+        self._progress.update(
             self._outer_task,
             completed=step,
-            time_display=format_time(elapsed),
+            time_display=_fmt_int(elapsed_sec),
             status=f"{step}/{self.outer_total}",
         )
         self._update_display()
 
     def reset_inner(self, new_total: int) -> None:
         """Reset the inner progress bar for a new outer iteration."""
-        self._inner_start_time = perf_counter()
+        self._inner_start_ns = monotonic_ns()
+        self._last_inner_sec = 0
         self._inner_completed_steps = 0
-        self._inner_progress.update(
+        self._inner_pushed_steps = 0
+        self._inner_total_steps = new_total
+        self._progress.update(
             self._inner_task,
             completed=0,
             total=new_total,
@@ -204,35 +270,41 @@ class ProgressManager:
     def advance_inner(self, step: int, total: int) -> None:
         """Advance the inner progress bar."""
         self._inner_completed_steps = step
-        elapsed = perf_counter() - self._inner_start_time
-        self._inner_progress.update(
+        elapsed_sec = (monotonic_ns() - self._inner_start_ns) // NS_PER_SEC
+        self._progress.update(
             self._inner_task,
             completed=step,
             total=total,
-            time_display=format_time(elapsed),
+            time_display=_fmt_int(elapsed_sec),
             status=f"{step}/{total}",
         )
         self._update_display()
 
+    def set_inner_completed(self, step: int) -> None:
+        """Record inner progress; the ticker pushes it to the bar."""
+        self._inner_completed_steps = step
+
     def complete_outer(self) -> None:
         """Mark outer progress as complete."""
-        elapsed = perf_counter() - self._outer_start_time
-        self._outer_progress.update(
+        elapsed_sec = (monotonic_ns() - self._outer_start_ns) // NS_PER_SEC
+        self._progress.update(
             self._outer_task,
             completed=self.outer_total,
-            time_display=format_time(elapsed),
+            time_display=_fmt_int(elapsed_sec),
             status="Complete!",
         )
         self._update_display()
 
     def complete_inner(self, total: int) -> None:
         """Mark inner progress as complete for current iteration."""
-        elapsed = perf_counter() - self._inner_start_time
-        self._inner_progress.update(
+        self._inner_completed_steps = total
+        self._inner_pushed_steps = total
+        elapsed_sec = (monotonic_ns() - self._inner_start_ns) // NS_PER_SEC
+        self._progress.update(
             self._inner_task,
             completed=total,
             total=total,
-            time_display=format_time(elapsed),
+            time_display=_fmt_int(elapsed_sec),
             status="Complete!",
         )
         self._update_display()
@@ -240,12 +312,12 @@ class ProgressManager:
     def _update_display(self) -> None:
         """Update the live display.
 
-        Note: With DynamicLayout, the display auto-refreshes 10 times per second,
-        so this method is now a no-op. Updates to progress/messages will be
-        picked up on the next render cycle.
+        Note: Live pulls a fresh layout 10 times per second, so this method is
+        a no-op. Updates to progress/messages will be picked up on the next
+        render cycle.
         """
         pass
 
     def get_outer_elapsed(self) -> float:
         """Get elapsed time for outer loop."""
-        return perf_counter() - self._outer_start_time
+        return (monotonic_ns() - self._outer_start_ns) / NS_PER_SEC
@@ -66,7 +66,7 @@ def generate_report(config: TaskConfig, stats: TaskStats) -> str:
 ## Execution Log
 
 ```
-{chr(10).join(stats.messages)}
+{chr(10).join(stats.log_lines())}
 ```
 
 ---
@@ -1,13 +1,39 @@
 """Async task execution with nested loops."""
 
-import random
-from datetime import datetime
+import asyncio
+import time
 
-import anyio
+import numpy as np
+from numba import njit
+from rich.text import Text
 
 from taskflow.config import TaskConfig, TaskStats
 from taskflow.progress import ProgressManager
 
+_RNG = np.random.default_rng()
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_MSG_START_OUTER = Text.from_markup("[bold magenta]Starting outer loop execution[/bold magenta]")
+_MSG_ALL_DONE = Text.from_markup("[bold green]All loops completed successfully![/bold green]")
+
+
+@njit(cache=True)
+def _plan_inner(n: int, p: float, s_min: float, span: float, seed: int) -> tuple[int, float]:
+    """
+    Plan one inner loop run.
+
+    Returns the number of iterations completed before a short-circuit (``n`` if
+    none occurred) and the total simulated sleep time for those iterations.
+    """
+    np.random.seed(seed)
+    total_sleep = 0.0
+    for i in range(n):
+        if i > 0 and np.random.random() < p:
+            return i, total_sleep
+        total_sleep += s_min + np.random.random() * span
+    return n, total_sleep
+
 
 async def inner_loop(
     config: TaskConfig,
@@ -15,42 +41,51 @@ async def inner_loop(
     progress: ProgressManager,
     outer_idx: int,
     middle_idx: int,
+    padding: float = 0.0,
 ) -> int:
     """
     Execute the innermost loop.
 
     Can short-circuit randomly before completing all iterations.
+    ``padding`` seconds are added to the simulated work so callers can fold
+    their own delays into the same await.
     Returns the actual number of iterations completed.
     """
     progress.add_message(
         f"[cyan]Starting inner loop[/cyan] (outer={outer_idx}, middle={middle_idx})"
     )
 
-    completed = 0
-    for i in range(config.inner_iterations):
-        # Random short-circuit check
-        if i > 0 and random.random() < config.short_circuit_probability:
-            progress.add_message(
-                f"[yellow]Short-circuit[/yellow] at inner iteration {i} "
-                f"(outer={outer_idx}, middle={middle_idx})"
-            )
-            stats.short_circuit_count += 1
-            stats.add_message(
-                f"Short-circuit at outer={outer_idx}, middle={middle_idx}, inner={i}"
-            )
-            break
+    # Decide up-front how many iterations run before a short-circuit, so the
+    # whole inner loop costs a single event-loop wakeup instead of one per step.
+    # The planning kernel is compiled; the await has to stay in Python.
+    n = config.inner_iterations
+    completed, total_sleep = _plan_inner(
+        n,
+        config.short_circuit_probability,
+        config.sleep_min,
+        config.sleep_span,
+        int(_RNG.integers(2**32)),
+    )
+    short_circuited = completed < n
 
-        # Simulate work
-        sleep_time = random.uniform(config.sleep_min, config.sleep_max)
-        await anyio.sleep(sleep_time)
+    # Simulate work
+    await asyncio.sleep(total_sleep + padding)
 
-        completed = i + 1
-        stats.total_inner_iterations += 1
+    stats.total_inner_iterations += completed
+    progress.add_verbose_message(
+        lambda: f"[dim]Inner progress:[/dim] {completed}/{n} "
+        f"(outer={outer_idx}, middle={middle_idx})"
+    )
 
-        if completed % 5 == 0 or completed == config.inner_iterations:
-            progress.add_message(
-                f"[dim]Inner progress:[/dim] {completed}/{config.inner_iterations} "
-                f"(outer={outer_idx}, middle={middle_idx})"
+    if short_circuited:
+        progress.add_message(
+            f"[yellow]Short-circuit[/yellow] at inner iteration {completed} "
+            f"(outer={outer_idx}, middle={middle_idx})"
+        )
+        stats.short_circuit_count += 1
+        if config.verbose:
+            stats.add_message(
+                f"Short-circuit at outer={outer_idx}, middle={middle_idx}, inner={completed}"
             )
 
     return completed
@@ -67,7 +102,7 @@ async def middle_loop(
 
     Tracks combined progress with inner loop on the second progress bar.
     """
-    progress.add_message(f"[blue]Starting middle loop[/blue] (outer={outer_idx})")
+    progress.add_message(Text.assemble(("Starting middle loop", "blue"), f" (outer={outer_idx})"))
 
     # Calculate total expected iterations for inner progress bar
     # This is middle_iterations * inner_iterations (max possible)
@@ -82,16 +117,15 @@ async def middle_loop(
             f"(outer={outer_idx})"
         )
 
-        # Execute inner loop
-        inner_completed = await inner_loop(config, stats, progress, outer_idx, j)
+        # Execute inner loop, including the small delay between middle iterations
+        inner_completed = await inner_loop(
+            config, stats, progress, outer_idx, j, padding=config.sleep_min
+        )
         cumulative_inner += inner_completed
         stats.total_middle_iterations += 1
 
-        # Update inner progress bar with cumulative progress
-        progress.advance_inner(cumulative_inner, total_inner_steps)
-
-        # Small delay between middle iterations
-        await anyio.sleep(config.sleep_min)
+        # Record cumulative progress; the progress ticker pushes it to the bar
+        progress.set_inner_completed(cumulative_inner)
 
     # Mark inner progress complete for this outer iteration
     progress.complete_inner(cumulative_inner)
@@ -111,12 +145,12 @@ async def outer_loop(
 
     Tracks progress on the first progress bar.
     """
-    progress.add_message("[bold magenta]Starting outer loop execution[/bold magenta]")
-    stats.add_message(f"Execution started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    progress.add_message(_MSG_START_OUTER)
+    stats.add_header_message(f"Execution started at {time.strftime(_TIMESTAMP_FORMAT)}")
 
     for i in range(config.outer_iterations):
         progress.add_message(
-            f"[bold cyan]Outer iteration {i + 1}/{config.outer_iterations}[/bold cyan]"
+            Text(f"Outer iteration {i + 1}/{config.outer_iterations}", style="bold cyan")
         )
         stats.add_message(f"Outer iteration {i + 1} started")
 
@@ -130,15 +164,15 @@ async def outer_loop(
 
     # Mark outer progress complete
     progress.complete_outer()
-    progress.add_message("[bold green]All loops completed successfully![/bold green]")
-    stats.add_message(f"Execution completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    progress.add_message(_MSG_ALL_DONE)
+    stats.add_message(f"Execution completed at {time.strftime(_TIMESTAMP_FORMAT)}")
 
 
 async def run_tasks(config: TaskConfig, stats: TaskStats, progress: ProgressManager) -> None:
     """Main entry point for task execution."""
-    stats.add_message("TaskFlow execution initialized")
-    stats.add_message(f"Configuration: outer={config.outer_iterations}, "
-                      f"middle={config.middle_iterations}, inner={config.inner_iterations}")
+    stats.add_header_message("TaskFlow execution initialized")
+    stats.add_header_message(f"Configuration: outer={config.outer_iterations}, "
+                             f"middle={config.middle_iterations}, inner={config.inner_iterations}")
 
     await outer_loop(config, stats, progress)
 